@@ -4,6 +4,8 @@ import datetime
 import io
 import os
 import json
+import pyarrow as pa
+from typing import NamedTuple
 
 # Set page configuration
 st.set_page_config(
@@ -19,11 +21,10 @@ def save_data_to_file(data):
     # Convert to records format for simpler serialization
     if not data.empty:
         # Ensure date is converted to string for JSON serialization
-        data_copy = data.copy()
-        if 'Date' in data_copy.columns and pd.api.types.is_datetime64_any_dtype(data_copy['Date']):
-            data_copy['Date'] = data_copy['Date'].dt.strftime('%Y-%m-%d')
+        if 'Date' in data.columns and pd.api.types.is_datetime64_any_dtype(data['Date']):
+            data = data.assign(Date=data['Date'].dt.strftime('%Y-%m-%d'))
         
-        records = data_copy.to_dict('records')
+        records = data.to_dict('records')
         with open('foobr_financial_data.json', 'w') as f:
             json.dump(records, f)
     else:
@@ -34,17 +35,71 @@ def save_data_to_file(data):
     # Debug info
     st.session_state['debug_message'] = f"Data saved: {len(data)} records"
             
+def optimize_dtypes(df):
+    """Narrow numeric columns of loaded records without losing precision.
+    
+    Orders becomes int32 only when every value is present and whole; text
+    or fractional counts are left as they were. Numeric money columns are
+    cast to float64, never narrower: float32 can't hold kobo amounts exactly
+    beyond roughly ₦160,000, and int64 would reject a later fractional update.
+    
+    Args:
+        df (pd.DataFrame): Loaded financial records
+        
+    Returns:
+        pd.DataFrame: The same frame with narrowed dtypes
+    """
+    if 'Orders' in df.columns:
+        orders = pd.to_numeric(df['Orders'], errors='coerce')
+        if orders.notna().all() and (orders % 1 == 0).all():
+            df['Orders'] = orders.astype('int32')
+    for column in CURRENCY_COLUMNS:
+        if column in df.columns and pd.api.types.is_numeric_dtype(df[column]):
+            df[column] = df[column].astype('float64')
+    return df
+
+def sort_by_date(df):
+    """Keep records in ascending Date order, skipping already-sorted frames.
+    
+    Args:
+        df (pd.DataFrame): Financial records
+        
+    Returns:
+        pd.DataFrame: Records ordered by Date
+    """
+    if 'Date' not in df.columns or df['Date'].is_monotonic_increasing:
+        return df
+    return df.sort_values('Date', kind='stable', ignore_index=True)
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def read_data_file(path, modified_ns):
+    """Read and parse the JSON data file into a DataFrame.
+    
+    Args:
+        path (str): Path to the JSON data file
+        modified_ns (int): File modification time; only part of the cache key,
+            so the file is parsed again whenever it changes on disk
+        
+    Returns:
+        pd.DataFrame: Parsed records (empty if the file holds none)
+    """
+    with open(path, 'r') as f:
+        records = json.load(f)
+    
+    df = pd.DataFrame(records)
+    if 'Date' in df.columns:
+        # Parse dates once here; everything downstream relies on datetime64
+        df['Date'] = pd.to_datetime(df['Date'], format='%Y-%m-%d')
+    return sort_by_date(optimize_dtypes(df))
+
 def load_data_from_file():
     """Load DataFrame from local file."""
     try:
         if os.path.exists('foobr_financial_data.json'):
-            with open('foobr_financial_data.json', 'r') as f:
-                records = json.load(f)
+            df = read_data_file('foobr_financial_data.json',
+                                os.stat('foobr_financial_data.json').st_mtime_ns)
             
-            if records:
-                df = pd.DataFrame(records)
-                if 'Date' in df.columns:
-                    df['Date'] = pd.to_datetime(df['Date'])
+            if not df.empty:
                 st.session_state['debug_message'] = f"Loaded {len(df)} records from file"
                 return df
             else:
@@ -56,8 +111,8 @@ def load_data_from_file():
     
     return pd.DataFrame()
 
-# Add minimal CSS for the black, grey, and white theme
-st.markdown("""
+# Minimal CSS for the black, grey, and white theme
+APP_CSS = """
 <style>
     .main-header {
         font-size: 2rem;
@@ -101,8 +156,68 @@ st.markdown("""
         margin-top: 1rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Re-emitted on every run: Streamlit drops elements a rerun doesn't repeat
+st.markdown(APP_CSS, unsafe_allow_html=True)
+
+# Storage/display labels for the fields of FinancialResults, in field order
+RESULT_LABELS = (
+    "Balance After Repairs",
+    "Total Daily Expenses",
+    "Balance After Expenses",
+    "Food Purchased",
+    "Closing Balance",
+    "Revenue",
+    "Orders",
+    "Average Order Value",
+)
+
+# Stored record columns holding Naira amounts
+CURRENCY_COLUMNS = (
+    "Starting Balance",
+    "Bike Repairs",
+    "Fuel",
+    "Airtime",
+    "End of Day Balance",
+    "Payout",
+    "Balance After Repairs",
+    "Total Expenses",
+    "Balance After Expenses",
+    "Food Purchased",
+    "Closing Balance",
+    "Revenue",
+    "Average Order Value",
+)
+
+# Display format for the Date column, applied by the dataframe renderer
+DATE_COLUMN_CONFIG = {"Date": st.column_config.DateColumn(format="MMM DD, YYYY")}
+
+# Date plus naira amounts, for the full records table
+RECORDS_COLUMN_CONFIG = {
+    **DATE_COLUMN_CONFIG,
+    **{column: st.column_config.NumberColumn(format="₦%,.2f") for column in CURRENCY_COLUMNS},
+}
+
+class FinancialResults(NamedTuple):
+    """Daily financial metrics returned by calculate_financials."""
+    balance_after_repairs: float
+    total_expenses: float
+    balance_after_expenses: float
+    food_purchased: float
+    closing_balance: float
+    revenue: float
+    orders: int
+    average_order_value: float
 
+    def to_record(self):
+        """Return the metrics as a dict keyed by their storage labels."""
+        return dict(zip(RESULT_LABELS, self))
+
+# FinancialResults is immutable, so cached instances are shared as-is
+# rather than pickled (pickling a class defined in this script breaks on
+# fragment reruns, which don't re-execute the module).
+@st.cache_resource(show_spinner=False, max_entries=128)
 def calculate_financials(starting_balance, bike_repairs, fuel, airtime,
                          end_of_day_balance, payout, orders):
     """Calculate daily financial metrics for the food delivery business."""
@@ -125,28 +240,94 @@ def calculate_financials(starting_balance, bike_repairs, fuel, airtime,
     revenue = closing_balance - balance_after_repairs
     
     # Calculate average order value
-    average_order_value = revenue / orders if orders > 0 else 0
-
-    return {
-        "Balance After Repairs": balance_after_repairs,
-        "Total Daily Expenses": total_expenses,
-        "Balance After Expenses": balance_after_expenses,
-        "Food Purchased": food_purchased,
-        "Closing Balance": closing_balance,
-        "Revenue": revenue,
-        "Orders": orders,
-        "Average Order Value": average_order_value
-    }
+    average_order_value = revenue / orders if orders > 0 else 0.0
+
+    return FinancialResults(
+        balance_after_repairs=balance_after_repairs,
+        total_expenses=total_expenses,
+        balance_after_expenses=balance_after_expenses,
+        food_purchased=food_purchased,
+        closing_balance=closing_balance,
+        revenue=revenue,
+        orders=orders,
+        average_order_value=average_order_value
+    )
+
+def format_report_date(report_date):
+    """Format a report date for display, e.g. 'January 05, 2025'."""
+    return report_date.strftime('%B %d, %Y')
+
+def format_currency_values(values):
+    """Format amounts as Naira strings, e.g. 1200 -> '₦1,200.00'.
+    
+    Args:
+        values (dict): Amounts keyed by label
+        
+    Returns:
+        dict: Formatted strings keyed by the same labels
+    """
+    return {label: f"₦{value:,.2f}" for label, value in values.items()}
 
-def save_to_csv(data_dict, report_date):
-    """Save financial data to CSV and ensure the file is properly created for download.
+def dataframe_to_csv(data):
+    """Serialize records to UTF-8 CSV bytes for download.
+    
+    Writing straight to a bytes buffer spares st.download_button from
+    encoding a second full copy of the text.
+    
+    Args:
+        data (pd.DataFrame): Records to export
+        
+    Returns:
+        bytes: CSV data with Unix line endings
+    """
+    buffer = io.BytesIO()
+    data.to_csv(buffer, index=False, lineterminator='\n', encoding='utf-8')
+    return buffer.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def build_xlsx_bytes(data):
+    """Build an Excel workbook of the records, cached on the frame contents.
+    
+    Args:
+        data (pd.DataFrame): Records to export
+        
+    Returns:
+        bytes: .xlsx file contents
+    """
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine='xlsxwriter') as writer:
+        data.to_excel(writer, sheet_name='Financial Data', index=False)
+    return buffer.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def build_parquet_bytes(data):
+    """Build a Parquet file of the records, cached on the frame contents.
+    
+    Merged CSVs can leave a column mixing numbers and text (e.g. "3,000"),
+    which pyarrow refuses; such columns are written as strings instead.
+    
+    Args:
+        data (pd.DataFrame): Records to export
+        
+    Returns:
+        bytes: .parquet file contents
+    """
+    try:
+        return data.to_parquet(index=False, engine='pyarrow', compression='snappy')
+    except pa.ArrowException:
+        mixed = data.select_dtypes(include='object').columns
+        return data.astype({column: 'string' for column in mixed}).to_parquet(
+            index=False, engine='pyarrow', compression='snappy')
+
+def save_record(data_dict, report_date):
+    """Save a day's financial data to session state and the data file.
     
     Args:
         data_dict (dict): Dictionary containing financial data
         report_date (datetime.date): Date of the financial report
         
     Returns:
-        str: CSV data as string for download
+        pd.DataFrame: All saved records, including this one
     """
     # Format the date
     formatted_date = report_date.strftime('%Y-%m-%d')
@@ -170,8 +351,9 @@ def save_to_csv(data_dict, report_date):
         'Average Order Value': data_dict['Average Order Value']
     }])
     
-    # Convert Date to datetime to ensure consistency
-    df['Date'] = pd.to_datetime(df['Date'])
+    # Convert Date to datetime and match the loaded column dtypes
+    df['Date'] = pd.to_datetime(df['Date'], format='%Y-%m-%d')
+    df = optimize_dtypes(df)
     
     # Initialize financial_data in session state if not exists
     if 'financial_data' not in st.session_state or st.session_state.financial_data is None:
@@ -180,52 +362,59 @@ def save_to_csv(data_dict, report_date):
         # Check if entry for this date already exists
         existing_data = st.session_state.financial_data
         
-        # Ensure Date column is datetime for comparison
-        if 'Date' in existing_data.columns and not pd.api.types.is_datetime64_any_dtype(existing_data['Date']):
-            existing_data['Date'] = pd.to_datetime(existing_data['Date'])
-        
         # Find matching dates to update
-        matching_dates = existing_data['Date'] == pd.to_datetime(formatted_date) if 'Date' in existing_data.columns else []
-        date_exists = any(matching_dates) if isinstance(matching_dates, pd.Series) else False
+        matching_dates = existing_data['Date'] == df['Date'].iloc[0] if 'Date' in existing_data.columns else []
+        date_exists = matching_dates.any() if isinstance(matching_dates, pd.Series) else False
         
         if date_exists:
-            # Update existing entry
-            existing_data.loc[matching_dates] = df.values
+            # Update existing entry column by column so each value is cast
+            # into that column's dtype (e.g. the int32 Orders column)
+            for column in df.columns:
+                existing_data.loc[matching_dates, column] = df.at[0, column]
             st.session_state.financial_data = existing_data
         else:
             # Append new entry
-            st.session_state.financial_data = pd.concat([existing_data, df], ignore_index=True)
+            st.session_state.financial_data = sort_by_date(pd.concat([existing_data, df], ignore_index=True))
     
     # Save to persistent storage
     save_data_to_file(st.session_state.financial_data)
     
-    # Return CSV data for download
-    csv_data = st.session_state.financial_data.to_csv(index=False)
+    return st.session_state.financial_data
+
+def period_cutoff(period, today):
+    """Return the first day of the week or month containing today.
     
-    return csv_data
+    Args:
+        period (str): 'week' (weeks start on Monday) or 'month'
+        today (pd.Timestamp): Current date, normalized to midnight
+        
+    Returns:
+        pd.Timestamp: Earliest date included in the period
+    """
+    if period == 'week':
+        return today - pd.Timedelta(days=today.dayofweek)
+    return today.to_period('M').start_time
 
 # Generate summary statistics
-def generate_summary(data, period=None):
-    """Generate basic summary statistics."""
+@st.cache_data(show_spinner=False, max_entries=32)
+def generate_summary(data):
+    """Generate basic summary statistics for already-filtered records."""
     if data.empty:
         return {}
     
-    # Filter by period if specified
-    if period == 'week':
-        today = pd.Timestamp.today()
-        start_of_week = today - pd.Timedelta(days=today.dayofweek)
-        data = data[data['Date'] >= start_of_week]
-    elif period == 'month':
-        today = pd.Timestamp.today()
-        start_of_month = today.replace(day=1)
-        data = data[data['Date'] >= start_of_month]
+    # Sum each column once; the daily averages divide those totals by the
+    # number of recorded days rather than reducing the columns again
+    revenue_days = data['Revenue'].count()
+    order_days = data['Orders'].count()
+    total_revenue = data['Revenue'].sum()
+    total_orders = data['Orders'].sum()
     
     summary = {
-        'Total Revenue': data['Revenue'].sum(),
-        'Average Daily Revenue': data['Revenue'].mean(),
-        'Total Orders': data['Orders'].sum(),
-        'Average Daily Orders': data['Orders'].mean(),
-        'Average Order Value': data['Revenue'].sum() / data['Orders'].sum() if data['Orders'].sum() > 0 else 0
+        'Total Revenue': total_revenue,
+        'Average Daily Revenue': total_revenue / revenue_days if revenue_days else 0,
+        'Total Orders': total_orders,
+        'Average Daily Orders': total_orders / order_days if order_days else 0,
+        'Average Order Value': total_revenue / total_orders if total_orders > 0 else 0
     }
     
     return summary
@@ -235,48 +424,79 @@ def filter_data_by_period(data, period):
     
     Args:
         data (pd.DataFrame): DataFrame containing financial data
-        period (str): Time period to filter by ('week', 'month', 'all')
+        period (str): Time period to filter by ('day', 'week', 'month', 'all')
         
     Returns:
         pd.DataFrame: Filtered DataFrame
     """
+    # Pass today's date explicitly so cached results roll over at midnight
+    return cached_period_filter(data, period, pd.Timestamp.today().normalize())
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def cached_period_filter(data, period, today):
+    """Filter data to the period containing the given (midnight) day."""
     if data.empty or 'Date' not in data.columns:
         return data
         
-    # Ensure Date column is datetime
+    # Ensure Date column is datetime without touching the caller's frame
     if not pd.api.types.is_datetime64_any_dtype(data['Date']):
-        data['Date'] = pd.to_datetime(data['Date'])
+        data = data.assign(Date=pd.to_datetime(data['Date']))
     
     # Filter based on period
-    if period == 'week':
-        today = pd.Timestamp.today()
-        start_of_week = today - pd.Timedelta(days=today.dayofweek)
-        return data[data['Date'] >= start_of_week]
-    elif period == 'month':
-        today = pd.Timestamp.today()
-        start_of_month = today.replace(day=1)
-        return data[data['Date'] >= start_of_month]
+    if period in ('week', 'month'):
+        return slice_date_range(data, period_cutoff(period, today))
     elif period == 'day':
-        today = pd.Timestamp.today().normalize()
-        return data[data['Date'] == today]
+        return slice_date_range(data, today, today)
     else:  # 'all'
         return data
 
-def load_data_from_csv(file):
+def slice_date_range(data, start, end=None):
+    """Select rows with start <= Date <= end (no upper bound if end is None).
+    
+    Records are kept sorted by Date, so the bounds are found by binary search
+    and the rows taken as one positional slice. Unsorted frames (e.g. with
+    missing dates) fall back to a boolean mask.
+    
+    Args:
+        data (pd.DataFrame): Financial records with a datetime Date column
+        start (pd.Timestamp): First date to include
+        end (pd.Timestamp, optional): Last date to include
+        
+    Returns:
+        pd.DataFrame: Records within the range
+    """
+    dates = data['Date']
+    if dates.is_monotonic_increasing:
+        lo = dates.searchsorted(start, side='left')
+        hi = len(dates) if end is None else dates.searchsorted(end, side='right')
+        return data.iloc[lo:hi]
+    if end is None:
+        return data[dates >= start]
+    return data[dates.between(start, end)]
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def parse_csv_bytes(file_bytes):
+    """Parse CSV bytes into a DataFrame, cached on the file contents."""
+    # pyarrow ships with Streamlit and parses in parallel
+    data = pd.read_csv(io.BytesIO(file_bytes), engine='pyarrow')
+    # Convert Date column to datetime if it exists
+    if 'Date' in data.columns:
+        data['Date'] = pd.to_datetime(data['Date'])
+    # Uploads are the likeliest to hold text or fractional Orders;
+    # optimize_dtypes leaves those as parsed rather than coercing them
+    return sort_by_date(optimize_dtypes(data))
+
+def load_data_from_csv(file_bytes):
     """Load financial data from uploaded CSV file.
     
     Args:
-        file: File object from st.file_uploader
+        file_bytes (bytes): Contents of the file from st.file_uploader
         
     Returns:
         pd.DataFrame: Loaded data
     """
     try:
-        data = pd.read_csv(file)
-        # Convert Date column to datetime if it exists
-        if 'Date' in data.columns:
-            data['Date'] = pd.to_datetime(data['Date'])
-        return data
+        return parse_csv_bytes(file_bytes)
     except Exception as e:
         st.error(f"Error loading CSV file: {e}")
         return pd.DataFrame()
@@ -285,6 +505,351 @@ def switch_to_data_storage_tab():
     """Helper function to switch to the Data Storage tab."""
     st.session_state.active_tab = "Data Storage"
 
+@st.fragment
+def render_summary(inputs, report_date):
+    """Render the daily summary and save controls for one set of inputs.
+
+    Running as a fragment means the "Save Record" click only reruns this
+    block instead of the whole app.
+
+    Args:
+        inputs (tuple): Starting balance, bike repairs, fuel, airtime,
+            end of day balance, payout and orders, in that order
+        report_date (datetime.date): Date of the financial report
+    """
+    (starting_balance, bike_repairs, fuel, airtime,
+     end_of_day_balance, payout, orders) = inputs
+
+    # Reuse the last results if the inputs haven't changed since then
+    if st.session_state.get('last_inputs') == inputs:
+        results = st.session_state['last_results']
+    else:
+        results = calculate_financials(*inputs)
+        st.session_state['last_inputs'] = inputs
+        st.session_state['last_results'] = results
+
+    # Store input data and results for saving
+    save_data = {
+        'Starting Balance': starting_balance,
+        'Bike Repairs': bike_repairs,
+        'Fuel': fuel,
+        'Airtime': airtime,
+        'End of Day Balance': end_of_day_balance,
+        'Payout': payout,
+        'Orders': orders
+    }
+    save_data.update(results.to_record())
+    fmt = format_currency_values(save_data)
+    
+    # Display results 
+    st.subheader(f"Daily Summary for {format_report_date(report_date)}")
+    
+    # Show key metrics at the top
+    metric_col1, metric_col2, metric_col3 = st.columns(3)
+    with metric_col1:
+        st.metric("Revenue", fmt['Revenue'])
+    with metric_col2:
+        st.metric("Orders", results.orders)
+    with metric_col3:
+        st.metric("Avg Order Value", fmt['Average Order Value'])
+    
+    st.markdown("---")
+    
+    # Create financial flow visualization (one markdown block per column)
+    st.subheader("Financial Flow")
+    flow_col1, flow_col2, flow_col3 = st.columns(3)
+    
+    with flow_col1:
+        st.markdown("\n\n".join([
+            f"**Starting Balance**\n{fmt['Starting Balance']}",
+            f"**- Bike Repairs**\n{fmt['Bike Repairs']}",
+            f"**= Balance After Repairs**\n{fmt['Balance After Repairs']}",
+        ]))
+        
+    with flow_col2:
+        st.markdown("\n\n".join([
+            f"**Balance After Repairs**\n{fmt['Balance After Repairs']}",
+            f"**- Fuel + Airtime**\n{fmt['Total Daily Expenses']}",
+            f"**= Balance After Expenses**\n{fmt['Balance After Expenses']}",
+        ]))
+        
+    with flow_col3:
+        st.markdown("\n\n".join([
+            f"**Balance After Expenses**\n{fmt['Balance After Expenses']}",
+            f"**- End of Day Balance**\n{fmt['End of Day Balance']}",
+            f"**= Food Purchased**\n{fmt['Food Purchased']}",
+        ]))
+    
+    st.markdown("---")
+    st.subheader("Final Results")
+    final_col1, final_col2 = st.columns(2)
+    
+    with final_col1:
+        st.markdown("\n\n".join([
+            f"**End of Day Balance**\n{fmt['End of Day Balance']}",
+            f"**+ Paystack Payout**\n{fmt['Payout']}",
+            f"**= Closing Balance**\n{fmt['Closing Balance']}",
+        ]))
+        
+    with final_col2:
+        st.markdown("\n\n".join([
+            f"**Closing Balance**\n{fmt['Closing Balance']}",
+            f"**- Balance After Repairs**\n{fmt['Balance After Repairs']}",
+            f"**= Revenue**\n{fmt['Revenue']}",
+        ]))
+    
+    # Save button after calculations
+    save_button = st.button("Save Record", use_container_width=True)
+
+    if save_button:
+        # Save to session and file
+        saved_records = save_record(save_data, report_date)
+        
+        # Store success message for data storage tab
+        st.session_state.last_saved_date = format_report_date(report_date)
+        st.session_state.show_storage_success = True
+        
+        # Rerun the whole app so Saved Records and Data Storage pick up the
+        # new record; daily_entry_form shows the message and download
+        st.session_state.saved_report = {
+            'message': f"✅ Data for {format_report_date(report_date)} saved successfully!",
+            'records': saved_records,
+            'file_name': f"foobr_financial_data_{report_date.strftime('%Y-%m-%d')}.csv",
+        }
+        st.rerun(scope="app")
+
+@st.fragment
+def daily_entry_form():
+    """Render the Daily Entry tab; its widgets rerun only this form."""
+    st.markdown("<h3 class='subheader'>Daily Financial Entry</h3>", unsafe_allow_html=True)
+    
+    # Add date selection
+    selected_day = st.selectbox("Select Day", ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"])
+    report_date = st.date_input("Select Date", datetime.date.today())
+    
+    # Create two columns for input form. Amounts are entered as whole naira,
+    # but save_record stores money columns as float64 like loaded records.
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### Starting Values")
+        starting_balance = st.number_input("Starting Balance", 
+                                          help="Total amount of money from the day before",
+                                          min_value=0,
+                                          value=0,
+                                          step=1,
+                                          format="%d")
+        bike_repairs = st.number_input("Bike Repairs & Company Expenses", 
+                                      help="Any expenses aside from fuel and airtime",
+                                      min_value=0,
+                                      value=0,
+                                      step=1,
+                                      format="%d")
+
+        st.markdown("### Daily Expenses")
+        fuel = st.number_input("Fuel", 
+                              help="Daily fuel expenses for delivery vehicles",
+                              min_value=0,
+                              value=0,
+                              step=1,
+                              format="%d")
+        airtime = st.number_input("Airtime", 
+                                 help="Daily communication expenses",
+                                 min_value=0,
+                                 value=0,
+                                 step=1,
+                                 format="%d")
+
+    with col2:
+        st.markdown("### End of Day Values")
+        end_of_day_balance = st.number_input("Balance Remaining", 
+                                            help="Balance remaining in all accounts after daily expenditures",
+                                            min_value=0,
+                                            value=0,
+                                            step=1,
+                                            format="%d")
+        payout = st.number_input("Payout from Paystack", 
+                                help="Total payments received through Paystack",
+                                min_value=0,
+                                value=0,
+                                step=1,
+                                format="%d")
+        orders = st.number_input("Number of Orders", 
+                                help="Total number of orders fulfilled today",
+                                min_value=0,
+                                value=0,
+                                step=1)
+
+    # Calculate and save buttons
+    col_btn1, _, col_btn3 = st.columns(3)
+    with col_btn1:
+        calculate_button = st.button("Calculate", use_container_width=True)
+    
+    with col_btn3:
+        go_to_storage_button = st.button("Go to Data Storage", 
+                                      on_click=switch_to_data_storage_tab,
+                                      use_container_width=True)
+    
+    # A fresh calculation replaces the last save's report
+    if calculate_button:
+        st.session_state.pop('saved_report', None)
+    
+    saved_report = st.session_state.get('saved_report')
+    if saved_report:
+        st.success(saved_report['message'])
+        saved_records = saved_report['records']
+        
+        # Serialize only when clicked; "ignore" keeps this button (and its
+        # deferred data) on screen instead of rerunning the form
+        st.download_button(
+            label="⬇️ Download Daily Report",
+            data=lambda: dataframe_to_csv(saved_records),
+            file_name=saved_report['file_name'],
+            mime="text/csv",
+            on_click="ignore",
+            use_container_width=True
+        )
+    
+    # Display the calculations
+    if calculate_button:
+        render_summary((starting_balance, bike_repairs, fuel, airtime,
+                        end_of_day_balance, payout, orders), report_date)
+
+@st.fragment
+def saved_records_view():
+    """Render the Saved Financial Records tab as its own fragment."""
+    st.markdown("<h3 class='subheader'>Saved Financial Records</h3>", unsafe_allow_html=True)
+    
+    # Get data from session state (saved financial records)
+    if 'financial_data' in st.session_state and not st.session_state.financial_data.empty:
+        data = st.session_state.financial_data
+    else:
+        # Try loading from file again as a backup
+        data = load_data_from_file()
+        if not data.empty:
+            st.session_state.financial_data = data
+            
+    # Button to force refresh data from file
+    if st.button("Refresh Data From File"):
+        read_data_file.clear()
+        st.session_state.financial_data = load_data_from_file()
+        st.session_state.records_notice = f"Data refreshed! Loaded {len(st.session_state.financial_data)} records."
+        # Rerun the whole app so the other tabs pick up the new records
+        st.rerun()
+    
+    # Show the outcome of a refresh or upload from the previous run
+    if 'records_notice' in st.session_state:
+        st.success(st.session_state.pop('records_notice'))
+            
+    # Option to upload previous records
+    with st.expander("Upload Previous Records"):
+        uploaded_file = st.file_uploader("Upload financial data CSV", type="csv")
+        # Merge each uploaded file once, not on every rerun it stays in the uploader
+        if uploaded_file is not None and st.session_state.get('imported_file_id') != uploaded_file.file_id:
+            imported_data = load_data_from_csv(uploaded_file.getvalue())
+            if not imported_data.empty:
+                if 'financial_data' not in st.session_state or st.session_state.financial_data.empty:
+                    st.session_state.financial_data = imported_data
+                else:
+                    # Merge data, keeping only unique dates
+                    combined = pd.concat([st.session_state.financial_data, imported_data])
+                    st.session_state.financial_data = sort_by_date(combined.drop_duplicates(subset=['Date']).reset_index(drop=True))
+                
+                # Save to persistent storage
+                save_data_to_file(st.session_state.financial_data)
+                st.session_state.imported_file_id = uploaded_file.file_id
+                st.session_state.records_notice = f"Loaded {len(imported_data)} records from CSV file."
+                st.rerun()
+    
+    if data is None or data.empty:
+        st.info("No financial records found. Add entries in the Daily Entry tab to see them here.")
+    else:
+        # Display data summaries by period
+        period = st.radio("Filter by:", ["All", "This Week", "This Month"], horizontal=True)
+        st.markdown("### Financial Records Summary")
+        
+        # Get weekly and monthly data
+        weekly_data = filter_data_by_period(data, 'week')
+        monthly_data = filter_data_by_period(data, 'month')
+        
+        # Reuse the period views for the records table instead of filtering again
+        period_views = {"All": data, "This Week": weekly_data, "This Month": monthly_data}
+        filtered_data = period_views[period]
+        
+        # Generate summaries
+        all_time_summary = generate_summary(data)
+        weekly_summary = generate_summary(weekly_data)
+        monthly_summary = generate_summary(monthly_data)
+        
+        # Only revenue is shown as an amount; empty periods have none
+        weekly_revenue = f"₦{weekly_summary.get('Total Revenue', 0):,.2f}"
+        monthly_revenue = f"₦{monthly_summary.get('Total Revenue', 0):,.2f}"
+        all_time_revenue = f"₦{all_time_summary.get('Total Revenue', 0):,.2f}"
+        
+        # Display summary tiles
+        summary_col1, summary_col2, summary_col3 = st.columns(3)
+        
+        with summary_col1:
+            st.markdown("#### This Week")
+            st.metric("Records", len(weekly_data))
+            st.metric("Revenue", weekly_revenue)
+            st.metric("Orders", f"{weekly_summary.get('Total Orders', 0)}")
+            with st.container():
+                if not weekly_data.empty:
+                    weekly_csv = dataframe_to_csv(weekly_data)
+                    st.download_button(
+                        label="Export Weekly Records (CSV)",
+                        data=weekly_csv,
+                        file_name=f"foobr_financial_data_weekly.csv",
+                        mime="text/csv",
+                        use_container_width=True
+                    )
+        
+        with summary_col2:
+            st.markdown("#### This Month")
+            st.metric("Records", len(monthly_data))
+            st.metric("Revenue", monthly_revenue)
+            st.metric("Orders", f"{monthly_summary.get('Total Orders', 0)}")
+            with st.container():
+                if not monthly_data.empty:
+                    monthly_csv = dataframe_to_csv(monthly_data)
+                    st.download_button(
+                        label="Export Monthly Records (CSV)",
+                        data=monthly_csv,
+                        file_name=f"foobr_financial_data_monthly.csv",
+                        mime="text/csv",
+                        use_container_width=True
+                    )
+        
+        with summary_col3:
+            st.markdown("#### All Time")
+            st.metric("Records", len(data))
+            st.metric("Revenue", all_time_revenue)
+            st.metric("Orders", f"{all_time_summary.get('Total Orders', 0)}")
+            with st.container():
+                if not data.empty:
+                    all_csv = dataframe_to_csv(data)
+                    st.download_button(
+                        label="Export All Records (CSV)",
+                        data=all_csv,
+                        file_name=f"foobr_financial_data_all_time.csv",
+                        mime="text/csv",
+                        use_container_width=True
+                    )
+        
+        # Display all records in a table
+        st.markdown("---")
+        st.subheader("All Financial Records")
+        
+        # Sort on the timestamps; dates and amounts are formatted by the
+        # dataframe renderer so the columns stay sortable
+        display_df = filtered_data
+        if not display_df.empty and 'Date' in display_df.columns:
+            display_df = display_df.sort_values('Date', ascending=False)
+        
+        # Show the data table
+        st.dataframe(display_df, column_config=RECORDS_COLUMN_CONFIG)
+
 # Main application
 def main():
     # Initialize debug message if not present
@@ -307,295 +872,12 @@ def main():
     
     # Daily Entry Page
     with tab1:
-        st.markdown("<h3 class='subheader'>Daily Financial Entry</h3>", unsafe_allow_html=True)
-        
-        # Add date selection
-        selected_day = st.selectbox("Select Day", ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"])
-        report_date = st.date_input("Select Date", datetime.date.today())
-        
-        # Create two columns for input form
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### Starting Values")
-            starting_balance = st.number_input("Starting Balance", 
-                                              help="Total amount of money from the day before",
-                                              value=0.0)
-            bike_repairs = st.number_input("Bike Repairs & Company Expenses", 
-                                          help="Any expenses aside from fuel and airtime",
-                                          value=0.0)
-
-            st.markdown("### Daily Expenses")
-            fuel = st.number_input("Fuel", 
-                                  help="Daily fuel expenses for delivery vehicles",
-                                  value=0.0)
-            airtime = st.number_input("Airtime", 
-                                     help="Daily communication expenses",
-                                     value=0.0)
-
-        with col2:
-            st.markdown("### End of Day Values")
-            end_of_day_balance = st.number_input("Balance Remaining", 
-                                                help="Balance remaining in all accounts after daily expenditures",
-                                                value=0.0)
-            payout = st.number_input("Payout from Paystack", 
-                                    help="Total payments received through Paystack",
-                                    value=0.0)
-            orders = st.number_input("Number of Orders", 
-                                    help="Total number of orders fulfilled today",
-                                    min_value=0,
-                                    value=0)
-
-        # Calculate and save buttons
-        col_btn1, col_btn2, col_btn3 = st.columns(3)
-        with col_btn1:
-            calculate_button = st.button("Calculate", use_container_width=True)
-        
-        with col_btn3:
-            go_to_storage_button = st.button("Go to Data Storage", 
-                                          on_click=switch_to_data_storage_tab,
-                                          use_container_width=True)
-        
-        # Display the calculations
-        if calculate_button:
-            results = calculate_financials(
-                starting_balance, bike_repairs, fuel, airtime,
-                end_of_day_balance, payout, orders
-            )
-
-            # Store input data and results for saving
-            save_data = {
-                'Starting Balance': starting_balance,
-                'Bike Repairs': bike_repairs,
-                'Fuel': fuel,
-                'Airtime': airtime,
-                'End of Day Balance': end_of_day_balance,
-                'Payout': payout,
-                'Orders': orders
-            }
-            save_data.update(results)
-            
-            # Display results 
-            st.subheader(f"Daily Summary for {report_date.strftime('%B %d, %Y')}")
-            
-            # Show key metrics at the top
-            metric_col1, metric_col2, metric_col3 = st.columns(3)
-            with metric_col1:
-                st.metric("Revenue", f"₦{results['Revenue']:,.2f}")
-            with metric_col2:
-                st.metric("Orders", results['Orders'])
-            with metric_col3:
-                st.metric("Avg Order Value", f"₦{results['Average Order Value']:,.2f}")
-            
-            st.markdown("---")
-            
-            # Create financial flow visualization
-            st.subheader("Financial Flow")
-            flow_col1, flow_col2, flow_col3 = st.columns(3)
-            
-            with flow_col1:
-                st.markdown(f"**Starting Balance**\n₦{starting_balance:,.2f}")
-                st.markdown(f"**- Bike Repairs**\n₦{bike_repairs:,.2f}")
-                st.markdown(f"**= Balance After Repairs**\n₦{results['Balance After Repairs']:,.2f}")
-                
-            with flow_col2:
-                st.markdown(f"**Balance After Repairs**\n₦{results['Balance After Repairs']:,.2f}")
-                st.markdown(f"**- Fuel + Airtime**\n₦{results['Total Daily Expenses']:,.2f}")
-                st.markdown(f"**= Balance After Expenses**\n₦{results['Balance After Expenses']:,.2f}")
-                
-            with flow_col3:
-                st.markdown(f"**Balance After Expenses**\n₦{results['Balance After Expenses']:,.2f}")
-                st.markdown(f"**- End of Day Balance**\n₦{end_of_day_balance:,.2f}")
-                st.markdown(f"**= Food Purchased**\n₦{results['Food Purchased']:,.2f}")
-            
-            st.markdown("---")
-            st.subheader("Final Results")
-            final_col1, final_col2 = st.columns(2)
-            
-            with final_col1:
-                st.markdown(f"**End of Day Balance**\n₦{end_of_day_balance:,.2f}")
-                st.markdown(f"**+ Paystack Payout**\n₦{payout:,.2f}")
-                st.markdown(f"**= Closing Balance**\n₦{results['Closing Balance']:,.2f}")
-                
-            with final_col2:
-                st.markdown(f"**Closing Balance**\n₦{results['Closing Balance']:,.2f}")
-                st.markdown(f"**- Balance After Repairs**\n₦{results['Balance After Repairs']:,.2f}")
-                st.markdown(f"**= Revenue**\n₦{results['Revenue']:,.2f}")
-            
-            # Save button after calculations
-            with col_btn2:
-                save_button = st.button("Save Record", use_container_width=True)
-
-            if save_button:
-                # Collect values even if Calculate wasn't clicked
-                save_data = {
-                    'Starting Balance': starting_balance,
-                    'Bike Repairs': bike_repairs,
-                    'Fuel': fuel,
-                    'Airtime': airtime,
-                    'End of Day Balance': end_of_day_balance,
-                    'Payout': payout,
-                    'Orders': orders
-                }
-
-                # Recalculate results from raw input
-                results = calculate_financials(
-                    starting_balance, bike_repairs, fuel, airtime,
-                    end_of_day_balance, payout, orders
-                )
-                save_data.update(results)
-
-                # Save to session and file
-                csv_data = save_to_csv(save_data, report_date)
-                st.session_state.financial_data = load_data_from_file()  # Reload to include saved entry
-                st.success(f"✅ Data for {report_date.strftime('%B %d, %Y')} saved successfully!")
-                
-                # Store success message for data storage tab
-                st.session_state.last_saved_date = report_date.strftime('%B %d, %Y')
-                st.session_state.show_storage_success = True
-                
-                st.download_button(
-                    label="⬇️ Download Daily Report",
-                    data=csv_data,
-                    file_name=f"foobr_financial_data_{report_date.strftime('%Y-%m-%d')}.csv",
-                    mime="text/csv",
-                    use_container_width=True
-                )
+        daily_entry_form()
 
     # Historical Data Page
     with tab2:
-        st.markdown("<h3 class='subheader'>Saved Financial Records</h3>", unsafe_allow_html=True)
-        
-        # Get data from session state (saved financial records)
-        if 'financial_data' in st.session_state and not st.session_state.financial_data.empty:
-            data = st.session_state.financial_data
-            
-            # Ensure Date column is datetime
-            if 'Date' in data.columns and not pd.api.types.is_datetime64_any_dtype(data['Date']):
-                data['Date'] = pd.to_datetime(data['Date'])
-        else:
-            # Try loading from file again as a backup
-            data = load_data_from_file()
-            if not data.empty:
-                st.session_state.financial_data = data
-                
-        # Button to force refresh data from file
-        if st.button("Refresh Data From File"):
-            fresh_data = load_data_from_file()
-            st.session_state.financial_data = fresh_data
-            data = fresh_data
-            st.success(f"Data refreshed! Loaded {len(data)} records.")
-                
-        # Option to upload previous records
-        with st.expander("Upload Previous Records"):
-            uploaded_file = st.file_uploader("Upload financial data CSV", type="csv")
-            if uploaded_file is not None:
-                imported_data = load_data_from_csv(uploaded_file)
-                if not imported_data.empty:
-                    if 'financial_data' not in st.session_state or st.session_state.financial_data.empty:
-                        st.session_state.financial_data = imported_data
-                    else:
-                        # Convert dates for proper comparison
-                        if 'Date' in imported_data.columns:
-                            imported_data['Date'] = pd.to_datetime(imported_data['Date'])
-                        
-                        if 'Date' in st.session_state.financial_data.columns:
-                            st.session_state.financial_data['Date'] = pd.to_datetime(st.session_state.financial_data['Date'])
-                            
-                        # Merge data, keeping only unique dates
-                        combined = pd.concat([st.session_state.financial_data, imported_data])
-                        st.session_state.financial_data = combined.drop_duplicates(subset=['Date']).reset_index(drop=True)
-                    
-                    # Save to persistent storage
-                    save_data_to_file(st.session_state.financial_data)
-                    data = st.session_state.financial_data
-                    st.success(f"Loaded {len(imported_data)} records from CSV file.")
-        
-        if data is None or data.empty:
-            st.info("No financial records found. Add entries in the Daily Entry tab to see them here.")
-        else:
-            # Display data summaries by period
-            period = st.radio("Filter by:", ["All", "This Week", "This Month"], horizontal=True)
-            filtered_data = filter_data_by_period(data, period.lower().replace("this ", ""))
-            st.markdown("### Financial Records Summary")
-            
-            # Ensure Date column is datetime
-            if 'Date' in data.columns and not pd.api.types.is_datetime64_any_dtype(data['Date']):
-                data['Date'] = pd.to_datetime(data['Date'])
-                
-            # Get weekly and monthly data
-            weekly_data = filter_data_by_period(data, 'week')
-            monthly_data = filter_data_by_period(data, 'month')
-            
-            # Generate summaries
-            all_time_summary = generate_summary(data)
-            weekly_summary = generate_summary(weekly_data)
-            monthly_summary = generate_summary(monthly_data)
-            
-            # Display summary tiles
-            summary_col1, summary_col2, summary_col3 = st.columns(3)
-            
-            with summary_col1:
-                st.markdown("#### This Week")
-                st.metric("Records", len(weekly_data))
-                st.metric("Revenue", f"₦{weekly_summary.get('Total Revenue', 0):,.2f}")
-                st.metric("Orders", f"{weekly_summary.get('Total Orders', 0)}")
-                with st.container():
-                    if not weekly_data.empty:
-                        weekly_csv = weekly_data.to_csv(index=False)
-                        st.download_button(
-                            label="Export Weekly Records (CSV)",
-                            data=weekly_csv,
-                            file_name=f"foobr_financial_data_weekly.csv",
-                            mime="text/csv",
-                            use_container_width=True
-                        )
-            
-            with summary_col2:
-                st.markdown("#### This Month")
-                st.metric("Records", len(monthly_data))
-                st.metric("Revenue", f"₦{monthly_summary.get('Total Revenue', 0):,.2f}")
-                st.metric("Orders", f"{monthly_summary.get('Total Orders', 0)}")
-                with st.container():
-                    if not monthly_data.empty:
-                        monthly_csv = monthly_data.to_csv(index=False)
-                        st.download_button(
-                            label="Export Monthly Records (CSV)",
-                            data=monthly_csv,
-                            file_name=f"foobr_financial_data_monthly.csv",
-                            mime="text/csv",
-                            use_container_width=True
-                        )
-            
-            with summary_col3:
-                st.markdown("#### All Time")
-                st.metric("Records", len(data))
-                st.metric("Revenue", f"₦{all_time_summary.get('Total Revenue', 0):,.2f}")
-                st.metric("Orders", f"{all_time_summary.get('Total Orders', 0)}")
-                with st.container():
-                    if not data.empty:
-                        all_csv = data.to_csv(index=False)
-                        st.download_button(
-                            label="Export All Records (CSV)",
-                            data=all_csv,
-                            file_name=f"foobr_financial_data_all_time.csv",
-                            mime="text/csv",
-                            use_container_width=True
-                        )
-            
-            # Display all records in a table
-            st.markdown("---")
-            st.subheader("All Financial Records")
-            
-            # Format display data
-            display_df = filtered_data.copy()
-            if not display_df.empty and 'Date' in display_df.columns:
-                display_df['Date'] = display_df['Date'].dt.strftime('%b %d, %Y')
-                display_df = display_df.sort_values('Date', ascending=False)
-            
-            # Show the data table
-            st.dataframe(display_df)
-    
+        saved_records_view()
+
     # New Data Storage Tab
     with tab3:
         st.markdown("<h3 class='subheader'>Data Storage</h3>", unsafe_allow_html=True)
@@ -614,10 +896,6 @@ def main():
         # Get data from session state
         if 'financial_data' in st.session_state and not st.session_state.financial_data.empty:
             data = st.session_state.financial_data
-            
-            # Ensure Date column is datetime
-            if 'Date' in data.columns and not pd.api.types.is_datetime64_any_dtype(data['Date']):
-                data['Date'] = pd.to_datetime(data['Date'])
         else:
             # Try loading from file again as a backup
             data = load_data_from_file()
@@ -643,31 +921,31 @@ def main():
                 "All Time": "all"
             }
             filtered_data = filter_data_by_period(data, period_mapping[export_period])
+            record_count = len(filtered_data)
             
             # Show data preview
             st.subheader(f"{export_period} Data Preview")
             
-            # Format display data
-            display_df = filtered_data.copy()
-            if not display_df.empty and 'Date' in display_df.columns:
-                display_df['Date'] = display_df['Date'].dt.strftime('%b %d, %Y')
-                display_df = display_df.sort_values('Date', ascending=False)
+            # Pick the 5 most recent rows
+            if record_count and 'Date' in filtered_data.columns:
+                display_df = filtered_data.nlargest(5, 'Date')
+            else:
+                display_df = filtered_data.head(5)
             
             # Show preview with max 5 rows
-            preview_rows = min(5, len(display_df))
-            st.dataframe(display_df.head(preview_rows))
+            st.dataframe(display_df, column_config=DATE_COLUMN_CONFIG)
             
             # Show record count
-            st.info(f"Total records for {export_period.lower()} period: {len(filtered_data)}")
+            st.info(f"Total records for {export_period.lower()} period: {record_count}")
             
             # Export options
             st.subheader("Export Options")
             
-            export_col1, export_col2 = st.columns(2)
+            export_col1, export_col2, export_col3 = st.columns(3)
             
             with export_col1:
-                if not filtered_data.empty:
-                    csv_data = filtered_data.to_csv(index=False)
+                if record_count:
+                    csv_data = dataframe_to_csv(filtered_data)
                     st.download_button(
                         label=f"📥 Export {export_period} Data as CSV",
                         data=csv_data,
@@ -677,42 +955,52 @@ def main():
                     )
             
             with export_col2:
-                if not filtered_data.empty:
-                    # Create Excel format
-                    buffer = io.BytesIO()
-                    with pd.ExcelWriter(buffer, engine='xlsxwriter') as writer:
-                        filtered_data.to_excel(writer, sheet_name='Financial Data', index=False)
-                    buffer.seek(0)
-                    
+                if record_count:
                     st.download_button(
                         label=f"📊 Export {export_period} Data as Excel",
-                        data=buffer,
+                        # Built only when clicked, then served from the cache
+                        data=lambda: build_xlsx_bytes(filtered_data),
                         file_name=f"foobr_financial_{export_period.lower().replace(' ', '_')}.xlsx",
                         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                         use_container_width=True
                     )
             
+            with export_col3:
+                if record_count:
+                    st.download_button(
+                        label=f"🗄️ Export {export_period} Data as Parquet",
+                        # Columnar and compressed; built only when clicked
+                        data=lambda: build_parquet_bytes(filtered_data),
+                        file_name=f"foobr_financial_{export_period.lower().replace(' ', '_')}.parquet",
+                        mime="application/octet-stream",
+                        use_container_width=True
+                    )
+            
             # Data summary metrics
-            if not filtered_data.empty:
+            if record_count:
                 st.markdown("### Data Summary")
                 
                 # Calculate summary stats
                 summary = generate_summary(filtered_data)
+                fmt = {
+                    label: f"₦{summary[label]:,.2f}"
+                    for label in ('Total Revenue', 'Average Order Value', 'Average Daily Revenue')
+                }
                 
                 # Display metrics in columns
                 metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
                 
                 with metric_col1:
-                    st.metric("Total Revenue", f"₦{summary.get('Total Revenue', 0):,.2f}")
+                    st.metric("Total Revenue", fmt['Total Revenue'])
                 
                 with metric_col2:
                     st.metric("Total Orders", f"{summary.get('Total Orders', 0)}")
                 
                 with metric_col3:
-                    st.metric("Avg Order Value", f"₦{summary.get('Average Order Value', 0):,.2f}")
+                    st.metric("Avg Order Value", fmt['Average Order Value'])
                 
                 with metric_col4:
-                    st.metric("Avg Daily Revenue", f"₦{summary.get('Average Daily Revenue', 0):,.2f}")
+                    st.metric("Avg Daily Revenue", fmt['Average Daily Revenue'])
                 
                 # Additional data management options
                 st.markdown("### Data Management")
@@ -722,15 +1010,14 @@ def main():
                 
                 with mgmt_col1:
                     # Backup data option
-                    st.markdown("#### Backup Data")
-                    st.markdown("Create a complete backup of all your financial records.")
+                    st.markdown("#### Backup Data\n\nCreate a complete backup of all your financial records.")
                     
                     if st.button("Create Full Backup", use_container_width=True):
                         # Create backup with timestamp
                         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
                         backup_filename = f"foobr_financial_backup_{timestamp}.csv"
                         
-                        backup_csv = data.to_csv(index=False)
+                        backup_csv = dataframe_to_csv(data)
                         st.download_button(
                             label="⬇️ Download Backup File",
                             data=backup_csv,
@@ -742,8 +1029,7 @@ def main():
                 
                 with mgmt_col2:
                     # Data cleanup options
-                    st.markdown("#### Filter Data")
-                    st.markdown("View and export data for a specific date range.")
+                    st.markdown("#### Filter Data\n\nView and export data for a specific date range.")
                     
                     # Date range selector
                     start_date = st.date_input("Start Date", 
@@ -760,22 +1046,18 @@ def main():
                         end_dt = pd.Timestamp(end_date) + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)  # Include end date fully
                         
                         # Apply filter
-                        date_filtered = data[(data['Date'] >= start_dt) & (data['Date'] <= end_dt)]
+                        date_filtered = slice_date_range(data, start_dt, end_dt)
                         
                         if date_filtered.empty:
                             st.warning("No records found for the selected date range.")
                         else:
                             st.success(f"Found {len(date_filtered)} records between {start_date} and {end_date}.")
                             
-                            # Format for display
-                            display_filtered = date_filtered.copy()
-                            display_filtered['Date'] = display_filtered['Date'].dt.strftime('%b %d, %Y')
-                            
                             # Show preview
-                            st.dataframe(display_filtered)
+                            st.dataframe(date_filtered, column_config=DATE_COLUMN_CONFIG)
                             
                             # Export option
-                            filtered_csv = date_filtered.to_csv(index=False)
+                            filtered_csv = dataframe_to_csv(date_filtered)
                             date_range_str = f"{start_date.strftime('%Y%m%d')}_to_{end_date.strftime('%Y%m%d')}"
                             
                             st.download_button(
@@ -791,25 +1073,17 @@ def main():
                     adv_col1, adv_col2 = st.columns(2)
                     
                     with adv_col1:
-                        st.markdown("#### Import & Merge Data")
-                        st.markdown("Import data from another CSV file and merge with existing records.")
+                        st.markdown("#### Import & Merge Data\n\nImport data from another CSV file and merge with existing records.")
                         
                         uploaded_merge = st.file_uploader("Upload CSV to merge", type="csv", key="merge_uploader")
                         if uploaded_merge is not None:
-                            imported_data = load_data_from_csv(uploaded_merge)
+                            imported_data = load_data_from_csv(uploaded_merge.getvalue())
                             if not imported_data.empty:
                                 if st.button("Merge with Existing Data"):
-                                    # Convert dates for proper comparison
-                                    if 'Date' in imported_data.columns:
-                                        imported_data['Date'] = pd.to_datetime(imported_data['Date'])
-                                    
-                                    if 'Date' in data.columns:
-                                        data['Date'] = pd.to_datetime(data['Date'])
-                                        
-                                    # Create combined dataset
+                                    # Create combined dataset (both Date columns are already parsed)
                                     combined = pd.concat([data, imported_data])
                                     # Drop duplicates by date
-                                    deduped = combined.drop_duplicates(subset=['Date']).reset_index(drop=True)
+                                    deduped = sort_by_date(combined.drop_duplicates(subset=['Date']).reset_index(drop=True))
                                     
                                     # Update session state and save
                                     st.session_state.financial_data = deduped
@@ -818,13 +1092,9 @@ def main():
                                     st.success(f"Successfully merged data! New total: {len(deduped)} records.")
                     
                     with adv_col2:
-                        st.markdown("#### Data Cleanup")
-                        st.markdown("Options for cleaning up or resetting your data.")
+                        st.markdown("#### Data Cleanup\n\nOptions for cleaning up or resetting your data.")
                         
                         if st.button("Deduplicate Records"):
-                            if 'Date' in data.columns:
-                                data['Date'] = pd.to_datetime(data['Date'])
-                                
                             # Count before deduplication
                             count_before = len(data)
                             